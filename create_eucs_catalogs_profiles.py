@@ -2,10 +2,13 @@
 
 import argparse
 import datetime
+import json
 import logging
 import pathlib
+import re
 import sys
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from uuid import uuid4
 
 from ilcli import Command  # CLI wrapper utility
@@ -21,74 +24,79 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 logger.addHandler(logging.StreamHandler(sys.stdout))
 
+# The script only builds known-good data, so OSCAL models are created without pydantic validation.
+# Pydantic v2 renamed construct() to model_construct(); pick whichever the installed version provides.
+_CONSTRUCT = 'model_construct' if hasattr(oscommon.Property, 'model_construct') else 'construct'
+
+# Function to instantiate an OSCAL model while skipping field validation
+def construct(model, **fields):
+    return getattr(model, _CONSTRUCT)(**fields)
+
 # Function to create an OSCAL Catalog object with metadata, groups, and back matter
 def create_catalog(uuid, metadata, groups, back_matter):
-    return oscat.Catalog(
+    return construct(oscat.Catalog,
         uuid=uuid, 
         metadata=metadata, 
         groups=groups, 
         back_matter=back_matter
     )
 
-# Function to create metadata for the catalog
-def create_metadata():
-    properties = []
-    # Add keywords related to cybersecurity and information security
-    properties.append(oscommon.Property(
+# Static metadata children, built once at import since they never change between runs
+_PARTY_UUID = "f550d94e-0f01-415f-a1e2-c8188c9ff4a5"
+
+# Keywords related to cybersecurity and information security
+_STATIC_PROPS = [
+    construct(oscommon.Property,
         name='keywords', 
         value='cybersecurity, information security, information system, OSCAL, Open Security Controls Assessment Language'
-    ))
-
-    # Create links for the metadata
-    links = []
-    links.append(oscommon.Link(rel="alternate", href="3ab41d8a-66e3-4732-ae28-07405dad5127"))
-
-    # Create roles (e.g., publisher, author, contact)
-    roles = []
-    roles.append(oscommon.Role(id='publisher', title='Source document converter to OSCAL.'))
-    roles.append(oscommon.Role(id='author', title='Source document author.'))
-    roles.append(oscommon.Role(id='contact', title='Contact.'))
-
-    # Add email addresses and physical addresses for the parties
-    email_addresses = []
-    email_addresses.append(oscommon.EmailAddress(__root__="name@domain.eu"))
-    address_lines = []
-    address_lines.append("ENISA")
-    address_lines.append("Attn: Somebody")
-    address_lines.append("1 Some Street")
-    addresses = []
-    addresses.append(oscommon.Address(addr_lines=address_lines, city="City", country="EU"))
-    
-    # Create party information (organization)
-    parties = []
-    parties.append(oscommon.Party(
+    )
+]
+
+# Links for the metadata
+_STATIC_LINKS = [construct(oscommon.Link, rel="alternate", href="3ab41d8a-66e3-4732-ae28-07405dad5127")]
+
+# Roles (e.g., publisher, author, contact)
+_STATIC_ROLES = [
+    construct(oscommon.Role, id='publisher', title='Source document converter to OSCAL.'),
+    construct(oscommon.Role, id='author', title='Source document author.'),
+    construct(oscommon.Role, id='contact', title='Contact.'),
+]
+
+# Party information (organization) with its email and physical addresses
+_STATIC_PARTIES = [
+    construct(oscommon.Party,
         type='organization', 
-        uuid="f550d94e-0f01-415f-a1e2-c8188c9ff4a5", 
+        uuid=_PARTY_UUID, 
         name="ENISA", 
-        email_addresses=email_addresses, 
-        addresses=addresses
-    ))
-
-    # Set responsible parties for publisher, author, and contact roles
-    partyuuids = []
-    partyuuids.append("f550d94e-0f01-415f-a1e2-c8188c9ff4a5")
-    responsible_parties = []
-    responsible_parties.append(oscommon.ResponsibleParty(role_id="publisher", party_uuids=partyuuids))
-    responsible_parties.append(oscommon.ResponsibleParty(role_id="author", party_uuids=partyuuids))
-    responsible_parties.append(oscommon.ResponsibleParty(role_id="contact", party_uuids=partyuuids))
-    
+        email_addresses=[construct(oscommon.EmailAddress, __root__="name@domain.eu")], 
+        addresses=[construct(oscommon.Address, addr_lines=["ENISA", "Attn: Somebody", "1 Some Street"], city="City", country="EU")]
+    )
+]
+
+# Responsible parties for publisher, author, and contact roles
+_STATIC_RESP_PARTIES = [
+    construct(oscommon.ResponsibleParty, role_id="publisher", party_uuids=[_PARTY_UUID]),
+    construct(oscommon.ResponsibleParty, role_id="author", party_uuids=[_PARTY_UUID]),
+    construct(oscommon.ResponsibleParty, role_id="contact", party_uuids=[_PARTY_UUID]),
+]
+
+# Function to create metadata for the catalog
+def create_metadata():
+    # Capture the timestamp once so published and last_modified are identical
+    now = datetime.datetime.now().astimezone()
+
     # Return the metadata object containing title, publication dates, roles, parties, etc.
-    return oscommon.Metadata(
+    return construct(oscommon.Metadata,
         title="Sample EUCS Catalog", 
-        published=datetime.datetime.now().astimezone(), 
-        last_modified=datetime.datetime.now().astimezone(), 
+        published=now, 
+        last_modified=now, 
         version="1.0", 
         oscal_version="1.1.2", 
-        props=properties, 
-        links=links, 
-        roles=roles, 
-        parties=parties, 
-        responsible_parties=responsible_parties, 
+        props=_STATIC_PROPS, 
+        links=_STATIC_LINKS, 
+        roles=_STATIC_ROLES, 
+        parties=_STATIC_PARTIES, 
+        responsible_parties=_STATIC_RESP_PARTIES, 
         remarks="The following is a short excerpt from EUCS Catalog. This work is provided here under copyright fair use for non-profit, educational purposes only. Copyrights for this work are held by the publisher."
     )
 
@@ -96,13 +104,13 @@ def create_metadata():
 def create_backmatter():
     rlinks = []
     # Add a reference link to the EUCS PDF document
-    rlinks.append(oscommon.Rlink(media_type="application/pdf", href="https://enisa.europa.eu/publications/eucs.pdf"))
+    rlinks.append(construct(oscommon.Rlink, media_type="application/pdf", href="https://enisa.europa.eu/publications/eucs.pdf"))
 
     resources = []
     # Create a resource object that links to the EUCS PDF
-    resources.append(oscommon.Resource(uuid="3ab41d8a-66e3-4732-ae28-07405dad5127", title="EUCS prCEN/TS (PDF)", rlinks=rlinks))
+    resources.append(construct(oscommon.Resource, uuid="3ab41d8a-66e3-4732-ae28-07405dad5127", title="EUCS prCEN/TS (PDF)", rlinks=rlinks))
 
-    return oscommon.BackMatter(
+    return construct(oscommon.BackMatter,
         resources=resources
     )
 
@@ -110,23 +118,23 @@ def create_backmatter():
 def create_category(category_id, category_title):
     properties = []
     # Set the label for the category
-    properties.append(oscommon.Property(name='label', value=category_id + '.'))
+    properties.append(construct(oscommon.Property, name='label', value=f'{category_id}.'))
 
-    return oscat.Group(
-        id='eucs-' + category_id, 
+    return construct(oscat.Group,
+        id=f'eucs-{category_id}', 
         title=category_title, 
         props=properties, 
         controls=[]  # Initialize with an empty list of controls
     )
 
 # Function to create a new control within a category
-def create_control(category_id, control_id, control_title):
+def create_control(control_prefix, control_id, control_title):
     properties = []
     # Set the label for the control
-    properties.append(oscommon.Property(name='label', value=control_id[-1] + '.'))
+    properties.append(construct(oscommon.Property, name='label', value=f'{control_id[-1]}.'))
 
-    return oscat.Control(
-        id='eucs-' + category_id + '.' + control_title.split()[0],  # Unique ID for the control
+    return construct(oscat.Control,
+        id=control_prefix,  # Unique ID for the control
         class_='eucs',  # Class name (EUCS control)
         title=control_title,  # Title of the control
         props=properties, 
@@ -134,56 +142,83 @@ def create_control(category_id, control_id, control_title):
     )
 
 # Function to create the objective headline (the goal of the control)
-def create_objective_headline(category_id, control_title, control_objective):
+def create_objective_headline(control_prefix, control_objective):
     properties = []
-    properties.append(oscommon.Property(name='label', value='1.'))  # Label for the objective
-    properties.append(oscommon.Property(name='alt-identifier', value='Objective'))  # Alternative identifier for the objective part
+    properties.append(construct(oscommon.Property, name='label', value='1.'))  # Label for the objective
+    properties.append(construct(oscommon.Property, name='alt-identifier', value='Objective'))  # Alternative identifier for the objective part
 
-    return oscommon.Part(
+    return construct(oscommon.Part,
         name='statement',  # The part's name (statement of the objective)
-        id='eucs-' + category_id + '.' + control_title.split()[0] + '_obj',  # Unique ID for the objective
+        id=f'{control_prefix}_obj',  # Unique ID for the objective
         props=properties, 
         prose=control_objective  # The actual content of the objective
     )
 
 # Function to create the requirements headline (the specific actions to fulfill the control)
-def create_requirement_headline(category_id, control_title):
+def create_requirement_headline(control_prefix):
     properties = []
-    properties.append(oscommon.Property(name='label', value='2.'))  # Label for the requirements
-    properties.append(oscommon.Property(name='alt-identifier', value='Requirements'))  # Alternative identifier for the requirements part
+    properties.append(construct(oscommon.Property, name='label', value='2.'))  # Label for the requirements
+    properties.append(construct(oscommon.Property, name='alt-identifier', value='Requirements'))  # Alternative identifier for the requirements part
 
-    return oscommon.Part(
+    return construct(oscommon.Part,
         name='statement',  # The part's name (statement of requirements)
-        id='eucs-' + category_id + '.' + control_title.split()[0] + '_req',  # Unique ID for the requirements
+        id=f'{control_prefix}_req',  # Unique ID for the requirements
         props=properties, 
         parts=[]  # Initialize with an empty list of requirement parts
     )
 
 # Function to create a requirement within the control (specific rule or action)
-def create_requirement(severity_level, requirement_id, category_id, control_title, requirement_description):
+def create_requirement(severity_level, requirement_id, requirement_part_id, requirement_prose):
     properties = []
     # Set an alternative identifier for the requirement part, based on the severity level (Basic, Substantial, High)
-    properties.append(oscommon.Property(name='alt-identifier', class_=severity_level, value=requirement_id))
+    properties.append(construct(oscommon.Property, name='alt-identifier', class_=severity_level, value=requirement_id))
 
-    return oscommon.Part(
+    return construct(oscommon.Part,
         name='item',  # Name for this requirement
         class_=severity_level,  # Class based on the severity level
-        id='eucs-' + category_id + '.' + control_title.split()[0] + '_req' + '.' + requirement_id[-2:],  # Unique ID for the requirement
+        id=requirement_part_id,  # Unique ID for the requirement
         props=properties, 
-        prose= requirement_id + ' - ' + requirement_description  # The content of the requirement
+        prose=requirement_prose  # The content of the requirement
     )
 
-# Function to write the OSCAL profile file, filtering the control list based on severity
-def write_profile(profile: ospro.Profile, control_list: List[str], path: pathlib.Path):
-    """Fill in control list and write the profile."""
-    include_controls: List[str] = []
-    selector = ospro.SelectControl()
-    selector.with_ids = control_list  # Add controls to include based on severity level
-    include_controls.append(selector)
-    profile.imports[0].include_controls = include_controls
-
-    # Write the profile to the specified path
-    profile.oscal_write(path)
+# Requirement id suffix of each severity level, and the lower-level suffixes that get rewritten to it
+_SEVERITY_SUFFIXES = {'basic': ('B', ''), 'substantial': ('S', 'B'), 'high': ('H', 'BS')}
+
+# Function to rewrite a requirement id to the given severity level (e.g. 'OIS-01.1B' -> 'OIS-01.1S')
+def _rekey(requirement_id, severity_level):
+    suffix, lower_suffixes = _SEVERITY_SUFFIXES[severity_level]
+    return requirement_id[:-1] + suffix if requirement_id[-1] in lower_suffixes else requirement_id
+
+# C0 control characters that XML 1.0 does not allow (tab, newline and carriage return are fine)
+_CONTROL_CHARACTERS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Function to turn a control character back into the OOXML '_xHHHH_' escape it was decoded from
+def _escape_control_character(match):
+    return f'_x{ord(match.group()):04X}_'
+
+# Function to serialize the profile once, so its metadata is not walked again for every severity level
+def serialize_profile(profile: ospro.Profile) -> dict:
+    """Serialize the profile, without any control selection, into a plain JSON-ready dict."""
+    return json.loads(profile.oscal_serialize_json())
+
+# Function to render the OSCAL profile file, filtering the control list based on severity
+def render_profile(profile_dict: dict, control_list: List[str]) -> bytes:
+    """Fill in control list on a copy of the serialized profile and return its JSON."""
+    profile_body = profile_dict['profile']
+    # Add controls to include based on severity level, leaving the shared serialized profile untouched
+    profile_import = {**profile_body['imports'][0], 'include-controls': [{'with-ids': control_list}]}
+    profile_json = {'profile': {**profile_body, 'imports': [profile_import]}}
+
+    return json.dumps(profile_json, indent=2, ensure_ascii=False).encode('utf8')
+
+# Function to write the catalog and the already rendered profiles concurrently, one worker thread per file
+def write_outputs(catalog: oscat.Catalog, catalog_path: pathlib.Path, profile_outputs: Dict[pathlib.Path, bytes]):
+    """Write the catalog and each profile payload to its path and wait for all writes to finish."""
+    with ThreadPoolExecutor(max_workers=len(profile_outputs) + 1) as executor:
+        futures = [executor.submit(catalog.oscal_write, catalog_path)]
+        futures += [executor.submit(path.write_bytes, payload) for path, payload in profile_outputs.items()]
+        for future in futures:
+            future.result()  # Re-raise any error from the writer thread
 
 import pathlib
 import pandas as pd
@@ -201,18 +236,6 @@ def run(input_xls: pathlib.Path, output_directory: pathlib.Path, EUCS_version: s
     EUCS_version (str): The version number of the EUCS catalog.
     """
     
-    # Load the Excel file
-    excel_handler = pd.ExcelFile(input_xls)
-    df = None
-    
-    # Search for the sheet containing 'controls' in its name
-    for key in excel_handler.sheet_names:
-        if 'controls' in str(key).lower():
-            sheet_name = key
-    
-    # Load the selected sheet into a DataFrame
-    df = pd.read_excel(input_xls, sheet_name=sheet_name, header=0, dtype=str)
-
     # Define key column names for the data
     category_key = 'EUCS Category'
     control_key = 'EUCS Control'
@@ -223,10 +246,37 @@ def run(input_xls: pathlib.Path, output_directory: pathlib.Path, EUCS_version: s
     substantial_key = 'Substantial'	
     high_key = 'High'
     
-    # Lists to store the requirements for different profiles
-    basic_profile = []
-    substantial_profile = []
-    high_profile = []
+    # Column order used to index into the row array below
+    columns = [category_key, control_key, requirement_key, title_key, description_key, basic_key, substantial_key, high_key]
+    CATEGORY, CONTROL, REQUIREMENT, TITLE, DESCRIPTION, BASIC, SUBSTANTIAL, HIGH = range(len(columns))
+
+    # Open the Excel file once with the Rust-backed calamine reader, which streams the sheet
+    # without building an XML cell tree, and reuse the handle for both the sheet lookup and the parse
+    with pd.ExcelFile(input_xls, engine='calamine') as excel_handler:
+        # Use the first sheet containing 'controls' in its name
+        sheet_name = next((key for key in excel_handler.sheet_names if 'controls' in str(key).lower()), None)
+        if sheet_name is None:
+            raise ValueError(f"No sheet with 'controls' in its name found in {input_xls}")
+
+        # Load only the needed columns of the selected sheet into a DataFrame
+        df = excel_handler.parse(sheet_name, header=0, usecols=columns, dtype=str)
+
+    # calamine decodes OOXML '_xHHHH_' escapes (e.g. 'DEV_x0002_01') into raw control characters;
+    # escape them again so the text matches what openpyxl produced and stays valid in OSCAL XML
+    for column in columns:
+        df[column] = df[column].str.replace(_CONTROL_CHARACTERS, _escape_control_character, regex=True)
+
+    # Pull the needed columns into a plain object array with empty cells turned into None in one pass,
+    # so the loop below does cheap array indexing and identity checks instead of building a Series per row
+    rows = df[columns].to_numpy(dtype=object, na_value=None)
+
+    # Column holding the marker for each severity level
+    severity_columns = (('basic', BASIC), ('substantial', SUBSTANTIAL), ('high', HIGH))
+
+    # Lists to store the requirements for different profiles, preallocated since each row
+    # adds at most one requirement per profile, with the number of filled slots of each
+    profiles = {severity_level: [None] * len(rows) for severity_level, _ in severity_columns}
+    profile_sizes = {severity_level: 0 for severity_level, _ in severity_columns}
 
     # Create metadata and backmatter objects for the catalog
     catalog_metadata = create_metadata()
@@ -235,148 +285,109 @@ def run(input_xls: pathlib.Path, output_directory: pathlib.Path, EUCS_version: s
     # Create a catalog object with initial metadata and an empty list of groups (categories)
     catalog = create_catalog(uuid="74c8ba1e-5cd4-4ad1-bbfd-d888e2f6c724", metadata=catalog_metadata, groups=[], back_matter=backmatter)
     
+    category_prefixes = {}  # 'eucs-<category>.' id prefix of each category, built once per category
     current_loop_category = None  # Track the current category
     current_loop_control = None   # Track the current control
     
-    # Iterate through each row in the DataFrame
-    for _, row in df.iterrows():        
+    # Iterate through each row of the array
+    for i in range(len(rows)):
+        row = rows[i]
+
         # Identify categories, controls, and requirements based on the conditions provided
-        new_loop_category = row[category_key]
-        new_loop_control = row[control_key]
+        new_loop_category = row[CATEGORY]
+        new_loop_control = row[CONTROL]
 
         # Adding a new category if the row contains a category but no control or requirement
-        if pd.isna(row[control_key]) and pd.isna(row[requirement_key]) and pd.notna(row[category_key]):
+        if row[CONTROL] is None and row[REQUIREMENT] is None and row[CATEGORY] is not None:
             # Add new category to catalog if it's a new one
             if new_loop_category != current_loop_category or current_loop_category is None:
                 category = create_category(
-                    category_id=row[category_key], 
-                    category_title=row[title_key]
+                    category_id=row[CATEGORY], 
+                    category_title=row[TITLE]
                 )
                 catalog.groups.append(category)
 
         # Adding a new control if the row contains a control but no requirement
-        elif pd.isna(row[requirement_key]) and pd.notna(row[category_key]) and pd.notna(row[control_key]):
+        elif row[REQUIREMENT] is None and row[CATEGORY] is not None and row[CONTROL] is not None:
             # Add new control to current category if it's a new one
             if new_loop_control != current_loop_control or current_loop_control is None:
+                # Build the id prefix shared by the control and all of its parts once,
+                # splitting off only the first word of the title
+                category_prefix = category_prefixes.get(row[CATEGORY])
+                if category_prefix is None:
+                    category_prefix = category_prefixes[row[CATEGORY]] = f'eucs-{row[CATEGORY]}.'
+                current_control_prefix = f'{category_prefix}{row[TITLE].split(None, 1)[0]}'
+                current_requirement_prefix = f'{current_control_prefix}_req.'
+
                 control = create_control(
-                    category_id=row[category_key], 
-                    control_id=row[control_key], 
-                    control_title=row[title_key]
+                    control_prefix=current_control_prefix, 
+                    control_id=row[CONTROL], 
+                    control_title=row[TITLE]
                 )
                 category.controls.append(control)
 
                 # Add an objective headline part to the control
                 objective_headline = create_objective_headline(
-                    category_id=row[category_key], 
-                    control_title=row[title_key], 
-                    control_objective=row[description_key]
+                    control_prefix=current_control_prefix, 
+                    control_objective=row[DESCRIPTION]
                 )
                 control.parts.append(objective_headline)
                 
                 # Add a requirement headline part to the control
                 requirement_headline = create_requirement_headline(
-                    category_id=row[category_key], 
-                    control_title=row[title_key]
+                    control_prefix=current_control_prefix
                 )
                 control.parts.append(requirement_headline)
-                current_loop_control_title = row[title_key]            
         
         # Adding requirements when all keys (category, control, requirement) are present
-        elif pd.notna(row[category_key]) and pd.notna(row[control_key]) and pd.notna(row[requirement_key]):
+        elif row[CATEGORY] is not None and row[CONTROL] is not None and row[REQUIREMENT] is not None:
             
-            # Add a basic requirement if present
-            if pd.notna(row[basic_key]):
-                requirement = create_requirement(
-                    severity_level='basic', 
-                    requirement_id=row[requirement_key], 
-                    category_id=row[category_key], 
-                    control_title=current_loop_control_title, 
-                    requirement_description=row[description_key]
-                )
-                # Add to basic profile
-                basic_profile.append(row[requirement_key])
-
-                # Append the requirement to the control's parts
-                requirement_headline.parts.append(requirement)
-                
-            # Add a substantial requirement if present
-            if pd.notna(row[substantial_key]):
-                # If the requirement ends with 'B', modify the key to 'S' for substantial
-                if row[requirement_key][-1] == 'B':
-                    new_requirement_key = row[requirement_key][:-1] + 'S'
-                    requirement = create_requirement(
-                        severity_level='substantial', 
-                        requirement_id=new_requirement_key, 
-                        category_id=row[category_key], 
-                        control_title=current_loop_control_title, 
-                        requirement_description=row[description_key]
-                    )
-                    substantial_profile.append(new_requirement_key)
-                else:
-                    requirement = create_requirement(
-                        severity_level='substantial', 
-                        requirement_id=row[requirement_key], 
-                        category_id=row[category_key], 
-                        control_title=current_loop_control_title, 
-                        requirement_description=row[description_key]
-                    )
-                    substantial_profile.append(row[requirement_key])
-                
-                # Append the requirement to the control's parts
-                requirement_headline.parts.append(requirement)
-
-            # Add a high requirement if present
-            if pd.notna(row[high_key]):
-                # Modify the key if the requirement ends with 'B' or 'S' to form 'H' for high severity
-                if row[requirement_key][-1] == 'B' or row[requirement_key][-1] == 'S':
-                    new_requirement_key = row[requirement_key][:-1] + 'H'
+            # Add a requirement for every severity level marked on the row
+            for severity_level, column in severity_columns:
+                if row[column] is not None:
+                    # A requirement without a description would otherwise end up as '<id> - None' in the prose
+                    if row[DESCRIPTION] is None:
+                        raise ValueError(f"Requirement {row[REQUIREMENT]} has no Description")
+
+                    # Rewrite the id suffix to match the severity level (e.g. 'B' -> 'S' for substantial)
+                    requirement_id = _rekey(row[REQUIREMENT], severity_level)
                     requirement = create_requirement(
-                        severity_level='high', 
-                        requirement_id=new_requirement_key, 
-                        category_id=row[category_key], 
-                        control_title=current_loop_control_title, 
-                        requirement_description=row[description_key]
+                        severity_level=severity_level, 
+                        requirement_id=requirement_id, 
+                        requirement_part_id=f'{current_requirement_prefix}{requirement_id[-2:]}', 
+                        requirement_prose=f'{requirement_id} - {row[DESCRIPTION]}'
                     )
-                    high_profile.append(new_requirement_key)
-                else:
-                    requirement = create_requirement(
-                        severity_level='high', 
-                        requirement_id=row[requirement_key], 
-                        category_id=row[category_key], 
-                        control_title=current_loop_control_title, 
-                        requirement_description=row[description_key]
-                    )
-                    high_profile.append(row[requirement_key])
-                
-                # Append the requirement to the control's parts
-                requirement_headline.parts.append(requirement)
+                    # Add to the profile of this severity level
+                    profiles[severity_level][profile_sizes[severity_level]] = requirement_id
+                    profile_sizes[severity_level] += 1
+
+                    # Append the requirement to the control's parts
+                    requirement_headline.parts.append(requirement)
         
         # Update the current loop category and control for the next iteration
-        current_loop_category = row[category_key]
-        current_loop_control = row[control_key]
+        current_loop_category = row[CATEGORY]
+        current_loop_control = row[CONTROL]
+
+    # Trim each profile to the slots actually filled
+    profiles = {severity_level: requirement_ids[:profile_sizes[severity_level]] for severity_level, requirement_ids in profiles.items()}
 
     # Define the path for saving the catalog as a JSON file
     catalog_path: pathlib.Path = pathlib.Path.cwd() / output_directory / f'EUCS_controls_version_{EUCS_version}_catalog.json'
-    catalog.oscal_write(catalog_path)
 
     # Create a profile for each severity level (Basic, Substantial, High)
-    profile = ospro.Profile(
+    profile = construct(ospro.Profile,
         uuid="74c8ba1e-5cd4-4ad1-bbfd-d888e2f6c724",
         metadata=catalog_metadata,
-        imports=[ospro.Import(href=catalog_path.name)]
+        imports=[construct(ospro.Import, href=catalog_path.name)]
     )
-
-    # Save the Basic profile
-    profile_path: pathlib.Path = output_directory / f'EUCS_version_{EUCS_version}_profile_Basic.json'
-    write_profile(profile, basic_profile, profile_path)
-
-    # Save the Substantial profile
-    profile_path: pathlib.Path = output_directory / f'EUCS_version_{EUCS_version}_profile_Substantial.json'
-    write_profile(profile, substantial_profile, profile_path)
-
-    # Save the High profile
-    profile_path: pathlib.Path = output_directory / f'EUCS_version_{EUCS_version}_profile_High.json'
-    write_profile(profile, high_profile, profile_path)
+    profile_dict = serialize_profile(profile)
+
+    # Render all profiles first, then write them together with the catalog
+    profile_outputs = {}
+    for severity_level, _ in severity_columns:
+        profile_path: pathlib.Path = output_directory / f'EUCS_version_{EUCS_version}_profile_{severity_level.capitalize()}.json'
+        profile_outputs[profile_path] = render_profile(profile_dict, profiles[severity_level])
+    write_outputs(catalog, catalog_path, profile_outputs)
 
 
 class EUCSConverter(Command):